@@ -1,43 +1,154 @@
 import os
 import json
+import asyncio
+import time
+import random
+from urllib.parse import quote
+import aiohttp
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 from datetime import datetime, timedelta
 import pytz
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from google.auth.transport.requests import Request as AuthRequest
 from dotenv import load_dotenv
 from typing import List
 import logging
-
-# Set up logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger('hackathon_bot')
+from functools import lru_cache
 
 # Load environment variables
 load_dotenv()
 
+# Set up logging
+LOG_LEVEL = getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), None)
+if not isinstance(LOG_LEVEL, int):
+    LOG_LEVEL = logging.INFO  # Fall back on unknown level names
+logging.basicConfig(level=LOG_LEVEL)
+logger = logging.getLogger('hackathon_bot')
+
 # Bot configuration
 DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
 DEFAULT_SPREADSHEET_ID = os.getenv('SPREADSHEET_ID')
 DEFAULT_REMINDER_DAYS = [int(x.strip()) for x in os.getenv('DEADLINE_REMINDER_DAYS', '7,3,1').split(',')]
 CONFIG_FILE = 'guild_config.json'
+TRACK_FILE = 'previous_hackathons.json'
+SHEET_CACHE_TTL = 60  # Seconds admin commands may reuse rows from the last check
+CHECK_TICK_SECONDS = 30  # How often the check loop wakes up to look for due guilds
+CHECK_INTERVAL_ACTIVE = 60  # Seconds until the next check after a sheet change
+CHECK_INTERVAL_IDLE = 300  # Seconds until the next check when nothing changed
+CHECK_INTERVAL_NIGHT = 3600  # Seconds until the next check overnight
+CHECK_JITTER = 15  # Max seconds of random offset added to each interval
+NIGHT_START_HOUR, NIGHT_END_HOUR = 0, 6  # Local hours treated as night
+SHEETS_SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets.readonly',
+    'https://www.googleapis.com/auth/drive.metadata.readonly'
+]
+SHEETS_VALUES_URL = 'https://sheets.googleapis.com/v4/spreadsheets/{}/values/A2:I'  # Assuming data starts from row 2
+HTTP_TIMEOUT = 30  # Seconds before a Google API request is abandoned
+DRIVE_FILE_URL = 'https://www.googleapis.com/drive/v3/files/{}'
+
+def load_credentials():
+    """Load the Google service account credentials once for all trackers"""
+    try:
+        return service_account.Credentials.from_service_account_file(
+            'credentials.json',
+            scopes=SHEETS_SCOPES
+        )
+    except Exception as e:
+        print(f"Error loading Google credentials: {e}")
+        return None
+
+_CREDS = load_credentials()
+_AUTH_REQUEST = AuthRequest()
+_token_lock = None
+_http_session = None
+
+def get_http_session():
+    """Return the shared aiohttp session, creating it on first use"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+        )
+    return _http_session
+
+async def get_access_token(force_refresh=False):
+    """Return a bearer token for the service account, refreshing it when needed"""
+    global _token_lock
+    if _CREDS is None:
+        return None
+    if _token_lock is None:
+        _token_lock = asyncio.Lock()
+    async with _token_lock:
+        if force_refresh or not _CREDS.valid:
+            # The refresh itself is a blocking HTTP call
+            await asyncio.to_thread(_CREDS.refresh, _AUTH_REQUEST)
+        return _CREDS.token
+
+CONFIG_FLUSH_DELAY = 2.0  # Seconds to coalesce config writes
 
 class GuildConfig:
     def __init__(self):
         self.config = self.load_config()
+        # Shadow map keyed by int snowflake, sharing the per-guild dicts with self.config
+        self._by_int = {int(k): v for k, v in self.config.items()}
+        self._dirty = False
+        self._flush_handle = None
 
     def load_config(self):
         try:
             with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
+                config = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
             return {}
+        for guild_data in config.values():
+            self.cache_ids(guild_data)
+        return config
+
+    @staticmethod
+    def cache_ids(guild_data: dict):
+        """Store int channel/role IDs so the check loop doesn't re-parse them"""
+        if 'notification_channel_id' in guild_data:
+            guild_data['_ncid'] = int(guild_data['notification_channel_id'])
+        if 'hackathon_role_id' in guild_data:
+            guild_data['_hrid'] = int(guild_data['hackathon_role_id'])
+        return guild_data
 
     def save_config(self):
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(self.config, f, indent=4)
+        """Schedule a debounced write so bursts of changes hit the disk once"""
+        self._dirty = True
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. during startup), write immediately
+            self.flush()
+            return
+        self._flush_handle = loop.call_later(CONFIG_FLUSH_DELAY, self.flush)
+
+    def flush(self):
+        """Atomically write the config to disk if it has pending changes"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._dirty:
+            return
+        tmp_file = CONFIG_FILE + '.tmp'
+        # Underscore keys are derived at load time and never persisted
+        config = {
+            guild_id: {k: v for k, v in guild_data.items() if not k.startswith('_')}
+            for guild_id, guild_data in self.config.items()
+        }
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(config, f, indent=4)
+            os.replace(tmp_file, CONFIG_FILE)
+            self._dirty = False
+        except OSError as e:
+            logger.error("Error saving guild config: %s", e)
 
     def get_guild_config(self, guild_id: str):
         config = self.config.get(str(guild_id), {})
@@ -48,8 +159,13 @@ class GuildConfig:
             config['reminder_days'] = DEFAULT_REMINDER_DAYS
         return config
 
+    def int_items(self):
+        """Iterate (int guild ID, config) pairs without str/int conversions"""
+        return self._by_int.items()
+
     def set_guild_config(self, guild_id: str, config_data: dict):
-        self.config[str(guild_id)] = config_data
+        self.config[str(guild_id)] = self.cache_ids(config_data)
+        self._by_int[int(guild_id)] = config_data
         self.save_config()
 
 class HackathonBot(commands.Bot):
@@ -59,152 +175,359 @@ class HackathonBot(commands.Bot):
         super().__init__(command_prefix="!", intents=intents)
         self.guild_config = GuildConfig()
         self.tracker = None
+        self.last_sheet = {}  # int guild ID -> (monotonic fetch time, rows) from the last check
 
     async def setup_hook(self):
         await self.tree.sync()
 
+    async def close(self):
+        # Make sure a pending debounced config write is not lost on shutdown
+        self.guild_config.flush()
+        if _http_session is not None and not _http_session.closed:
+            await _http_session.close()
+        await super().close()
+
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+
+def _fast_mdy(date_str):
+    """Parse an M/D/YYYY string without going through strptime"""
+    try:
+        p = date_str.split('/')
+        return datetime(int(p[2]), int(p[0]), int(p[1])) if len(p) == 3 else None
+    except (ValueError, AttributeError):
+        return None
+
+@lru_cache(maxsize=4096)
+def _parse_mdy(date_str):
+    """Cached M/D/YYYY parse, the same sheet dates recur every tick"""
+    return _fast_mdy(date_str)
+
+@lru_cache(maxsize=4096)
+def _mdy_ordinal(date_str):
+    """Cached proleptic ordinal of an M/D/YYYY string, or None if unparseable"""
+    date_obj = _parse_mdy(date_str)
+    return date_obj.toordinal() if date_obj else None
+
+def find_deadline_reminders(hackathons, reminder_set, today_ord):
+    """Return (days_until, row) for every row whose deadline falls on a reminder day"""
+    reminders = []
+    for hackathon in hackathons:
+        if len(hackathon) < 5 or not hackathon[4]:
+            continue
+        deadline_ord = _mdy_ordinal(hackathon[4])
+        if deadline_ord is not None and deadline_ord - today_ord in reminder_set:
+            reminders.append((deadline_ord - today_ord, hackathon))
+    return reminders
+
+@lru_cache(maxsize=4096)
+def _format_mdy(date_str):
+    """Convert date from M/D/YYYY to Month D, YYYY"""
+    if not date_str:
+        return "N/A"
+    date_obj = _parse_mdy(date_str)
+    if date_obj is None:
+        return date_str
+    return f"{_MONTHS[date_obj.month - 1]} {date_obj.day:02d}, {date_obj.year}"
+
+async def _get_json(url, params=None):
+    """GET a Google API URL with the service account token, retrying once on 401"""
+    session = get_http_session()
+    for attempt in range(2):
+        token = await get_access_token(force_refresh=attempt > 0)
+        if token is None:
+            raise RuntimeError("credentials.json could not be loaded")
+        async with session.get(url, params=params, headers={'Authorization': f'Bearer {token}'}) as r:
+            # Retry once with a fresh token if the cached one was rejected
+            if r.status == 401 and attempt == 0:
+                continue
+            r.raise_for_status()
+            return await r.json()
+
 class HackathonTracker:
     def __init__(self, spreadsheet_id):
-        self.service = None
         self.spreadsheet_id = spreadsheet_id
-        self.setup_google_sheets()
-
-    def setup_google_sheets(self):
-        """Set up Google Sheets API connection"""
+        # The ID is admin-supplied, escape it so it can't alter the request path or query
+        self.url = SHEETS_VALUES_URL.format(quote(spreadsheet_id, safe=''))
+        self.revision_url = DRIVE_FILE_URL.format(quote(spreadsheet_id, safe=''))
+        self.connected = False  # Whether the last fetch succeeded
+        self._last_revision = None
+        self._last_rows = None
+        self._use_revision = True  # Cleared once Drive refuses the metadata request
+
+    async def get_revision(self):
+        """Return the sheet's Drive modifiedTime, or None if it can't be read"""
+        if not self._use_revision:
+            return None
         try:
-            creds = service_account.Credentials.from_service_account_file(
-                'credentials.json',
-                scopes=['https://www.googleapis.com/auth/spreadsheets.readonly']
-            )
-            self.service = build('sheets', 'v4', credentials=creds)
+            result = await _get_json(self.revision_url, params={'fields': 'modifiedTime'})
+            return result.get('modifiedTime')
+        except aiohttp.ClientResponseError as e:
+            if e.status in (403, 404):
+                # Drive API disabled or file not visible to Drive, stop probing this sheet
+                logger.debug("Disabling revision checks for %s: %s", self.spreadsheet_id, e)
+                self._use_revision = False
+            else:
+                logger.debug("Could not read revision for %s: %s", self.spreadsheet_id, e)
+            return None
         except Exception as e:
-            print(f"Error setting up Google Sheets: {e}")
+            logger.debug("Could not read revision for %s: %s", self.spreadsheet_id, e)
+            return None
 
-    def get_hackathons(self):
-        """Fetch hackathon data from Google Sheets"""
+    async def fetch(self):
+        """Fetch hackathon rows from the Sheets REST API, or None on failure"""
         try:
-            sheet = self.service.spreadsheets()
-            result = sheet.values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range='A2:I'  # Assuming data starts from row 2
-            ).execute()
-            return result.get('values', [])
+            # The metadata response is tiny, skip the full values fetch if the sheet is unchanged
+            revision = await self.get_revision()
+            if revision is not None and revision == self._last_revision and self._last_rows is not None:
+                self.connected = True
+                return self._last_rows
+            rows = (await _get_json(self.url)).get('values', [])
+            self._last_revision = revision
+            self._last_rows = rows
+            self.connected = True
+            # Only trackers for readable sheets are kept for reuse
+            _tracker_cache.setdefault(self.spreadsheet_id, self)
+            return rows
         except Exception as e:
             print(f"Error fetching hackathon data: {e}")
-            return []
+        self.connected = False
+        return None
 
-    def parse_date(self, date_str):
-        """Parse date string to datetime object"""
-        if not date_str:
-            return None
-        try:
-            return datetime.strptime(date_str, '%m/%d/%Y')
-        except:
-            return None
+    async def get_hackathons(self):
+        """Fetch hackathon data from Google Sheets"""
+        return await self.fetch() or []
+
+def load_previous_hackathons():
+    """Load tracked hackathon names per guild saved by a previous run"""
+    try:
+        with open(TRACK_FILE, 'r') as f:
+            return {int(guild_id): set(names) for guild_id, names in json.load(f).items()}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_previous_hackathons():
+    """Atomically write tracked hackathon names per guild to disk"""
+    tmp_file = TRACK_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump({str(guild_id): sorted(names) for guild_id, names in previous_hackathons.items()}, f, indent=4)
+    os.replace(tmp_file, TRACK_FILE)
 
 bot = HackathonBot()
-previous_hackathons = {}  # Dict to store previous hackathons per guild
+previous_hackathons = load_previous_hackathons()  # Dict to store previous hackathons per guild (int guild ID keys)
+_tracker_cache = {}  # Dict to reuse one tracker per spreadsheet ID
+
+def get_tracker(spreadsheet_id):
+    """Return the cached tracker for a spreadsheet, or a new one that is cached after its first successful fetch"""
+    tracker = _tracker_cache.get(spreadsheet_id)
+    if tracker is None:
+        tracker = HackathonTracker(spreadsheet_id)
+    return tracker
+
+def invalidate_tracker(spreadsheet_id):
+    """Drop a cached tracker so the next lookup rebuilds it"""
+    _tracker_cache.pop(spreadsheet_id, None)
+
+def prune_trackers(spreadsheet_ids):
+    """Evict cached trackers for spreadsheets no guild uses anymore"""
+    for spreadsheet_id in list(_tracker_cache):
+        if spreadsheet_id not in spreadsheet_ids:
+            del _tracker_cache[spreadsheet_id]
+
+async def fetch_all_hackathons(spreadsheet_ids):
+    """Fetch hackathon data for several spreadsheets concurrently over one session"""
+    trackers = [get_tracker(sid) for sid in spreadsheet_ids]
+    rows = await asyncio.gather(*(tracker.fetch() for tracker in trackers))
+    return {
+        tracker.spreadsheet_id: result
+        for tracker, result in zip(trackers, rows)
+        if result is not None
+    }
+
+# Embed fields in sheet column order: (name, inline, is_date)
+_FIELDS = (
+    ("Name", True, False),
+    ("Website", True, False),
+    ("Start Date", True, True),
+    ("End Date", True, True),
+    ("Deadline", True, True),
+    ("Status", True, False),
+    ("Place", True, False),
+    ("Respond By", True, True),
+    ("Notes", False, False),
+)
 
 def create_hackathon_embed(hackathon_data, title):
     """Create a Discord embed for hackathon information"""
     embed = discord.Embed(title=title, color=0x00ff00)
-    
-    def format_date(date_str):
-        """Convert date from M/D/YYYY to Month D, YYYY"""
-        if not date_str:
-            return "N/A"
-        try:
-            date_obj = datetime.strptime(date_str, '%m/%d/%Y')
-            return date_obj.strftime('%B %d, %Y')
-        except:
-            return date_str
-
-    fields = {
-        0: ("Name", True),
-        1: ("Website", True),
-        2: ("Start Date", True),
-        3: ("End Date", True),
-        4: ("Deadline", True),
-        5: ("Status", True),
-        6: ("Place", True),
-        7: ("Respond By", True),
-        8: ("Notes", False)
-    }
 
-    for i, (field_name, inline) in fields.items():
-        if i < len(hackathon_data) and hackathon_data[i]:
-            value = hackathon_data[i]
-            # Format dates for specific fields
-            if field_name in ["Start Date", "End Date", "Deadline", "Respond By"]:
-                value = format_date(value)
-            embed.add_field(name=field_name, value=value or "N/A", inline=inline)
+    for (field_name, inline, is_date), value in zip(_FIELDS, hackathon_data):
+        if not value:
+            continue
+        if is_date:
+            value = _format_mdy(value)
+        embed.add_field(name=field_name, value=value, inline=inline)
 
     embed.timestamp = datetime.now()
     return embed
 
-@tasks.loop(minutes=1)  # Changed to 1 minute for testing, can change back to 30 later
-async def check_hackathons():
-    """Regular check for hackathon updates and deadlines"""
-    global previous_hackathons
-    logger.info("Running hackathon check...")
-    
-    for guild_id, guild_data in bot.guild_config.config.items():
-        try:
-            if not all(key in guild_data for key in ['spreadsheet_id', 'notification_channel_id', 'hackathon_role_id']):
-                logger.warning(f"Guild {guild_id} missing required configuration")
-                continue
+MAX_EMBEDS_PER_MESSAGE = 10  # Discord's limit on embeds in a single message
+MAX_EMBED_CHARS_PER_MESSAGE = 6000  # Discord's limit on total embed text in a single message
+
+def chunk_embeds(embeds):
+    """Group embeds into batches that fit Discord's per-message count and size limits"""
+    chunk, size = [], 0
+    for embed in embeds:
+        embed_size = len(embed)
+        if chunk and (len(chunk) >= MAX_EMBEDS_PER_MESSAGE or size + embed_size > MAX_EMBED_CHARS_PER_MESSAGE):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(embed)
+        size += embed_size
+    if chunk:
+        yield chunk
+
+async def send_embeds(channel, content, embeds):
+    """Send embeds in as few messages as Discord allows, pinging once per message.
+
+    content may be a callable taking the number of embeds in the message.
+    """
+    for chunk in chunk_embeds(embeds):
+        await channel.send(
+            content(len(chunk)) if callable(content) else content,
+            embeds=chunk,
+            allowed_mentions=discord.AllowedMentions(roles=True)
+        )
 
-            channel = bot.get_channel(int(guild_data['notification_channel_id']))
-            if not channel:
-                logger.warning(f"Could not find channel for guild {guild_id}")
-                continue
+async def _process_guild(guild_id, guild_data, sheet_results, today_ord):
+    """Send new hackathon and deadline notifications for one guild.
 
-            if guild_id not in previous_hackathons:
-                previous_hackathons[guild_id] = set()
-                logger.info(f"Initialized tracking for guild {guild_id}")
+    Returns True if the guild's tracked hackathons changed.
+    """
+    try:
+        if not all(key in guild_data for key in ['spreadsheet_id', 'notification_channel_id', 'hackathon_role_id']):
+            logger.warning("Guild %s missing required configuration", guild_id)
+            return False
+
+        channel = bot.get_channel(guild_data['_ncid'])
+        if not channel:
+            logger.warning("Could not find channel for guild %s", guild_id)
+            return False
+
+        if guild_id not in previous_hackathons:
+            previous_hackathons[guild_id] = set()
+            logger.debug("Initialized tracking for guild %s", guild_id)
+
+        if guild_data['spreadsheet_id'] not in sheet_results:
+            logger.warning("No sheet data fetched for guild %s", guild_id)
+            return False
+        hackathons = sheet_results[guild_data['spreadsheet_id']]
+        bot.last_sheet[guild_id] = (time.monotonic(), hackathons)
+        
+        logger.debug("Found %d hackathons for guild %s", len(hackathons), guild_id)
 
-            tracker = HackathonTracker(guild_data['spreadsheet_id'])
-            hackathons = tracker.get_hackathons()
-            current_hackathons = set()
-            
-            logger.info(f"Found {len(hackathons)} hackathons for guild {guild_id}")
-            
+        # Diff names once instead of probing the tracked set per row
+        previous = previous_hackathons[guild_id]
+        current_hackathons = {h[0] for h in hackathons if h}
+        new_names = current_hackathons - previous
+
+        # Check for new hackathons
+        new_embeds = []
+        if new_names:
             for hackathon in hackathons:
-                if not hackathon or len(hackathon) < 1:
+                if not hackathon or hackathon[0] not in new_names:
                     continue
+                logger.info("New hackathon found in guild %s: %s", guild_id, hackathon[0])
+                new_embeds.append(create_hackathon_embed(hackathon, "New Hackathon Alert! 🎉"))
+
+        # Check deadlines
+        deadline_embeds = []
+        reminder_set = set(guild_data.get('reminder_days', DEFAULT_REMINDER_DAYS))
+        for days_until, hackathon in find_deadline_reminders(hackathons, reminder_set, today_ord):
+            logger.info("Sending deadline reminder for %s (%d days)", hackathon[0], days_until)
+            deadline_embeds.append(create_hackathon_embed(hackathon, f"⚠️ Deadline in {days_until} days!"))
+
+        role_ping = f"<@&{guild_data['_hrid']}>"
+        new_sent = True
+        try:
+            await send_embeds(
+                channel,
+                lambda n: f"{role_ping} A new hackathon has been added!" if n == 1 else f"{role_ping} {n} new hackathons have been added!",
+                new_embeds
+            )
+        except discord.HTTPException as e:
+            # Still send reminders, new hackathons are retried next check since tracking isn't updated
+            logger.error("Error sending new hackathons for guild %s: %s", guild_id, e)
+            new_sent = False
+        await send_embeds(channel, f"{role_ping} Deadline reminder!", deadline_embeds)
+        if not new_sent:
+            return False
+
+        # Update tracking set
+        logger.debug("Updating tracking for guild %s. Previous: %d, Current: %d", guild_id, len(previous), len(current_hackathons))
+        changed = current_hackathons != previous
+        previous_hackathons[guild_id] = current_hackathons
+        return changed
+
+    except Exception as e:
+        logger.error("Error processing guild %s: %s", guild_id, e, exc_info=True)
+        return False
+
+next_run_at = {}  # int guild ID -> monotonic time the guild is next due for a check
+
+def schedule_next_check(guild_id, changed):
+    """Pick when a guild is next checked based on whether its sheet just changed"""
+    if changed:
+        delay = CHECK_INTERVAL_ACTIVE
+    elif NIGHT_START_HOUR <= datetime.now().hour < NIGHT_END_HOUR:
+        delay = CHECK_INTERVAL_NIGHT
+    else:
+        delay = CHECK_INTERVAL_IDLE
+    # Jitter so guilds don't all hit Google at the same moment
+    next_run_at[guild_id] = time.monotonic() + delay + random.uniform(-CHECK_JITTER, CHECK_JITTER)
 
-                name = hackathon[0]
-                current_hackathons.add(name)
-                
-                # Check for new hackathons
-                if name not in previous_hackathons[guild_id]:
-                    logger.info(f"New hackathon found in guild {guild_id}: {name}")
-                    embed = create_hackathon_embed(hackathon, "New Hackathon Alert! 🎉")
-                    await channel.send(
-                        f"<@&{guild_data['hackathon_role_id']}> A new hackathon has been added!",
-                        embed=embed
-                    )
-
-                # Check deadlines
-                if len(hackathon) >= 5 and hackathon[4]:
-                    deadline = tracker.parse_date(hackathon[4])
-                    if deadline:
-                        days_until = (deadline - datetime.now()).days
-                        reminder_days = guild_data.get('reminder_days', DEFAULT_REMINDER_DAYS)
-                        if days_until in reminder_days:
-                            logger.info(f"Sending deadline reminder for {name} ({days_until} days)")
-                            embed = create_hackathon_embed(hackathon, f"⚠️ Deadline in {days_until} days!")
-                            await channel.send(
-                                f"<@&{guild_data['hackathon_role_id']}> Deadline reminder!",
-                                embed=embed
-                            )
-
-            # Update tracking set
-            logger.info(f"Updating tracking for guild {guild_id}. Previous: {len(previous_hackathons[guild_id])}, Current: {len(current_hackathons)}")
-            previous_hackathons[guild_id] = current_hackathons
+@tasks.loop(seconds=CHECK_TICK_SECONDS)
+async def check_hackathons(force=False):
+    """Regular check for hackathon updates and deadlines"""
+    logger.debug("Running hackathon check...")
+
+    now = time.monotonic()
+    due = [
+        (guild_id, guild_data)
+        for guild_id, guild_data in bot.guild_config.int_items()
+        if force or now >= next_run_at.get(guild_id, 0)
+    ]
+    if not due:
+        return
 
-        except Exception as e:
-            logger.error(f"Error processing guild {guild_id}: {str(e)}", exc_info=True)
+    # Group guilds by spreadsheet so each sheet is fetched once per tick
+    by_sheet = {}
+    for guild_id, guild_data in due:
+        if 'spreadsheet_id' in guild_data:
+            by_sheet.setdefault(guild_data['spreadsheet_id'], []).append(guild_id)
+    sheet_results = await fetch_all_hackathons(list(by_sheet))
+    prune_trackers({
+        guild_data['spreadsheet_id']
+        for _, guild_data in bot.guild_config.int_items()
+        if 'spreadsheet_id' in guild_data
+    })
+    today_ord = datetime.now().toordinal()
+
+    # Guilds are independent, so let their Discord sends overlap
+    results = await asyncio.gather(
+        *(_process_guild(guild_id, guild_data, sheet_results, today_ord)
+          for guild_id, guild_data in due),
+        return_exceptions=True
+    )
+    for (guild_id, _), result in zip(due, results):
+        schedule_next_check(guild_id, result is True)
+
+    # Only touch the disk when tracking state actually changed
+    if any(result is True for result in results):
+        try:
+            save_previous_hackathons()
+        except OSError as e:
+            logger.error("Error saving tracked hackathons: %s", e)
 
 @check_hackathons.before_loop
 async def before_check_hackathons():
@@ -247,9 +570,9 @@ async def setup(
         reminder_days_list = DEFAULT_REMINDER_DAYS
 
     # Test Google Sheets connection
-    tracker = HackathonTracker(spreadsheet_id)
-    test_data = tracker.get_hackathons()
-    if not tracker.service:
+    tracker = get_tracker(spreadsheet_id)
+    test_data = await tracker.get_hackathons()
+    if not tracker.connected:
         await interaction.response.send_message("Failed to connect to Google Sheets. Please check your credentials and spreadsheet ID. (try adding this email as an editor of the sheet: murder-of-codes@hackathons-434015.iam.gserviceaccount.com)", ephemeral=True)
         return
 
@@ -318,8 +641,8 @@ async def list_hackathons(interaction: discord.Interaction):
         )
         return
 
-    tracker = HackathonTracker(guild_config['spreadsheet_id'])
-    hackathons = tracker.get_hackathons()
+    tracker = get_tracker(guild_config['spreadsheet_id'])
+    hackathons = await tracker.get_hackathons()
     
     if not hackathons:
         await interaction.response.send_message("No hackathons found!", ephemeral=True)
@@ -327,14 +650,16 @@ async def list_hackathons(interaction: discord.Interaction):
 
     await interaction.response.send_message("Fetching hackathons...", ephemeral=True)
     
-    for hackathon in hackathons:
-        if hackathon and len(hackathon) > 0:
-            embed = create_hackathon_embed(hackathon, "Hackathon Information")
-            await interaction.channel.send(embed=embed)
+    embeds = [
+        create_hackathon_embed(hackathon, "Hackathon Information")
+        for hackathon in hackathons
+        if hackathon and len(hackathon) > 0
+    ]
+    await send_embeds(interaction.channel, None, embeds)
 
 @bot.event
 async def on_ready():
-    logger.info(f'{bot.user} has connected to Discord!')
+    logger.info('%s has connected to Discord!', bot.user)
     if not check_hackathons.is_running():
         check_hackathons.start()
         logger.info("Hackathon check loop started")
@@ -355,15 +680,20 @@ async def change_spreadsheet(
     guild_config = bot.guild_config.get_guild_config(guild_id)
 
     # Test Google Sheets connection with new ID
-    tracker = HackathonTracker(spreadsheet_id)
-    test_data = tracker.get_hackathons()
-    if not tracker.service:
+    invalidate_tracker(spreadsheet_id)
+    tracker = get_tracker(spreadsheet_id)
+    test_data = await tracker.get_hackathons()
+    if not tracker.connected:
         await interaction.response.send_message("Failed to connect to Google Sheets. Please check your spreadsheet ID.", ephemeral=True)
         return
 
     # Update configuration with new spreadsheet ID
+    old_spreadsheet_id = guild_config.get('spreadsheet_id')
+    if old_spreadsheet_id and old_spreadsheet_id != spreadsheet_id:
+        invalidate_tracker(old_spreadsheet_id)
     guild_config['spreadsheet_id'] = spreadsheet_id
     bot.guild_config.set_guild_config(guild_id, guild_config)
+    bot.last_sheet.pop(interaction.guild_id, None)
 
     await interaction.response.send_message(
         f"Successfully updated the spreadsheet ID!\n"
@@ -408,7 +738,7 @@ async def force_check(interaction: discord.Interaction):
         await interaction.response.send_message("You need administrator permissions to use this command!", ephemeral=True)
         return
 
-    guild_id = str(interaction.guild_id)
+    guild_id = interaction.guild_id
     
     # Show current tracking state
     current_tracked = previous_hackathons.get(guild_id, set())
@@ -419,7 +749,7 @@ async def force_check(interaction: discord.Interaction):
     )
     
     # Force a check
-    await check_hackathons()
+    await check_hackathons(force=True)
     
     # Show new tracking state
     new_tracked = previous_hackathons.get(guild_id, set())
@@ -437,7 +767,7 @@ async def debug_tracking(interaction: discord.Interaction):
         await interaction.response.send_message("You need administrator permissions to use this command!", ephemeral=True)
         return
 
-    guild_id = str(interaction.guild_id)
+    guild_id = interaction.guild_id
     tracked_hackathons = previous_hackathons.get(guild_id, set())
     
     embed = discord.Embed(title="Hackathon Tracking Debug Info", color=0x00ff00)
@@ -450,8 +780,15 @@ async def debug_tracking(interaction: discord.Interaction):
     # Get current hackathons from sheet
     guild_config = bot.guild_config.get_guild_config(guild_id)
     if 'spreadsheet_id' in guild_config:
-        tracker = HackathonTracker(guild_config['spreadsheet_id'])
-        current_hackathons = tracker.get_hackathons()
+        # Reuse the rows from the last check if they are fresh enough
+        cached = bot.last_sheet.get(guild_id)
+        if cached and time.monotonic() - cached[0] < SHEET_CACHE_TTL:
+            current_hackathons = cached[1]
+        else:
+            tracker = get_tracker(guild_config['spreadsheet_id'])
+            current_hackathons = await tracker.get_hackathons()
+            if tracker.connected:
+                bot.last_sheet[guild_id] = (time.monotonic(), current_hackathons)
         current_names = {h[0] for h in current_hackathons if h and len(h) > 0}
         
         embed.add_field(